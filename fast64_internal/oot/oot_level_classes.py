@@ -3,6 +3,7 @@ import os
 import shutil
 
 from typing import Optional
+from operator import attrgetter
 from bpy.types import Object
 from ..utility import PluginError, toAlnum, indent
 from .collision.exporter import OOTCollision
@@ -24,6 +25,8 @@ class OOTCommonCommands:
 
 
 class OOTActor:
+    __slots__ = ("actorName", "actorID", "actorParam", "position", "rotation")
+
     def __init__(self, actorName, actorID, position, rotation, actorParam):
         self.actorName = actorName
         self.actorID = actorID
@@ -33,6 +36,18 @@ class OOTActor:
 
 
 class OOTTransitionActor:
+    __slots__ = (
+        "actorName",
+        "actorID",
+        "actorParam",
+        "frontRoom",
+        "backRoom",
+        "frontCam",
+        "backCam",
+        "position",
+        "rotationY",
+    )
+
     def __init__(self, actorName, actorID, frontRoom, backRoom, frontCam, backCam, position, rotationY, actorParam):
         self.actorName = actorName
         self.actorID = actorID
@@ -51,6 +66,8 @@ class OOTExit:
 
 
 class OOTEntrance:
+    __slots__ = ("roomIndex", "startPositionIndex")
+
     def __init__(self, roomIndex, startPositionIndex):
         self.roomIndex = roomIndex
         self.startPositionIndex = startPositionIndex
@@ -81,10 +98,11 @@ class OOTScene(OOTCommonCommands):
     def __init__(self, name, model):
         self.name: str = toAlnum(name)
         self.write_dummy_room_list = False
+        self.writeActorNames = True
         self.rooms = {}
         self.transitionActorList = set()
         self.entranceList = set()
-        self.startPositions = {}
+        self.startPositions: list[Optional[OOTActor]] = []
         self.lights = []
         self.model = model
         self.collision = OOTCollision(self.name)
@@ -125,6 +143,7 @@ class OOTScene(OOTCommonCommands):
     def getAlternateHeaderScene(self, name):
         scene = OOTScene(name, self.model)
         scene.write_dummy_room_list = self.write_dummy_room_list
+        scene.writeActorNames = self.writeActorNames
         scene.rooms = self.rooms
         scene.collision = self.collision
         scene.exitList = []
@@ -176,15 +195,22 @@ class OOTScene(OOTCommonCommands):
         self.validateRoomIndices()
 
     def validateStartPositions(self):
-        count = 0
-        while count < len(self.startPositions):
-            if count not in self.startPositions:
-                raise PluginError(
-                    "Error: Entrances (start positions) do not have a consecutive list of indices. "
-                    + "Missing index: "
-                    + str(count)
-                )
-            count = count + 1
+        if None in self.startPositions:
+            raise PluginError(
+                "Error: Entrances (start positions) do not have a consecutive list of indices. "
+                + "Missing index: "
+                + str(self.startPositions.index(None))
+            )
+
+        # alternate headers can have their own entrances, these would otherwise reach the C writer unchecked
+        if self.childNightHeader is not None:
+            self.childNightHeader.validateStartPositions()
+        if self.adultDayHeader is not None:
+            self.adultDayHeader.validateStartPositions()
+        if self.adultNightHeader is not None:
+            self.adultNightHeader.validateStartPositions()
+        for header in self.cutsceneHeaders:
+            header.validateStartPositions()
 
     def validateRoomIndices(self):
         count = 0
@@ -213,7 +239,7 @@ class OOTScene(OOTCommonCommands):
         return room
 
     def sortEntrances(self):
-        self.entranceList = sorted(self.entranceList, key=lambda x: x.startPositionIndex)
+        self.entranceList = sorted(self.entranceList, key=attrgetter("startPositionIndex"))
         if self.appendNullEntrance:
             self.entranceList.append(OOTEntrance(0, 0))
 
@@ -513,7 +539,9 @@ def addStartPosition(scene, index, actor, actorProp, actorObjName):
         raise PluginError("Unhandled scene setup preset: " + str(sceneSetup.sceneSetupPreset))
 
 
-def addStartPosAtIndex(startPosDict, index, value):
-    if index in startPosDict:
+def addStartPosAtIndex(startPosList: list[Optional[OOTActor]], index: int, value: OOTActor):
+    while len(startPosList) <= index:
+        startPosList.append(None)
+    if startPosList[index] is not None:
         raise PluginError("Error: Repeated start position spawn index: " + str(index))
-    startPosDict[index] = value
+    startPosList[index] = value
@@ -82,6 +82,9 @@ actorsWithRotAsParam = {
     "ACTOR_OBJ_TIMEBLOCK": "Z",
 }
 
+transActorEntryRegex = re.compile(r"(?:\{(.*?)\}\s*,)|(?:\{([a-zA-Z0-9\-_.,{}\s]*[^{]*)\},)")
+transActorCleanupRegex = re.compile(r"[\s{}]")
+
 
 def checkBit(value: int, index: int) -> bool:
     return (1 & (value >> index)) == 1
@@ -691,16 +694,17 @@ def parseTransActorList(
 ):
     transitionActorList = getDataMatch(sceneData, transActorListName, "TransitionActorEntry", "transition actor list")
 
-    regex = r"(?:\{(.*?)\}\s*,)|(?:\{([a-zA-Z0-9\-_.,{}\s]*[^{]*)\},)"
-    for actorMatch in re.finditer(regex, transitionActorList):
-        actorMatch = actorMatch.group(0).replace(" ", "").replace("\n", "").replace("{", "").replace("}", "")
-
-        params = [value.strip() for value in actorMatch.split(",") if value.strip() != ""]
+    for actorMatch in transActorEntryRegex.finditer(transitionActorList):
+        params = list(filter(None, transActorCleanupRegex.sub("", actorMatch.group(0)).split(",")))
+        if len(params) != 10:
+            raise PluginError(f"ERROR: Expected 10 values in transition actor entry, got {len(params)}: {params}")
 
-        position = tuple([hexOrDecInt(value) for value in params[5:8]])
+        position = tuple(map(hexOrDecInt, params[5:8]))
 
-        rotY = getEvalParams(params[8]) if "DEG_TO_BINANG" in params[8] else params[8]
-        rotation = tuple([0, hexOrDecInt(rotY), 0])
+        rotY = params[8]
+        if "DEG_TO_BINANG" in rotY:
+            rotY = getEvalParams(rotY)
+        rotation = (0, hexOrDecInt(rotY), 0)
 
         roomIndexFront = hexOrDecInt(params[0])
         camFront = params[1]
@@ -722,7 +726,7 @@ def parseTransActorList(
         if not sharedSceneData.addHeaderIfItemExists(actorHash, "Transition Actor", headerIndex):
             actorObj = createEmptyWithTransform(position, [0, 0, 0] if actorID in actorsWithRotAsParam else rotation)
             actorObj.ootEmptyType = "Transition Actor"
-            actorObj.name = "Transition " + getDisplayNameFromActorID(params[4])
+            actorObj.name = "Transition " + getDisplayNameFromActorID(actorID)
             transActorProp = actorObj.ootTransitionActorProperty
 
             sharedSceneData.transDict[actorHash] = actorObj
@@ -756,7 +760,7 @@ def parseEntranceList(
     # see also start position list
     entrances = []
     for entranceMatch in re.finditer(rf"\{{(.*?)\}}\s*,", entranceList, flags=re.DOTALL):
-        params = [value.strip() for value in entranceMatch.group(1).split(",") if value.strip() != ""]
+        params = list(filter(None, map(str.strip, entranceMatch.group(1).split(","))))
         roomIndex = hexOrDecInt(params[1])
         spawnIndex = hexOrDecInt(params[0])
 
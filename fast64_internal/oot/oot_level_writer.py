@@ -1,4 +1,5 @@
-import bpy, os, math, mathutils
+import bpy, os, math, mathutils, functools
+from bpy.types import Object
 from ..f3d.f3d_gbi import TextureExportSettings
 from ..f3d.f3d_writer import TriangleConverterInfo, saveStaticModel, getInfoDict
 from .scene.properties import OOTSceneProperties, OOTSceneHeaderProperty, OOTAlternateSceneHeaderProperty
@@ -55,6 +56,9 @@ from .oot_utility import (
     ootConvertRotation,
     getSceneDirFromLevelName,
     isPathObject,
+    buildChildIndex,
+    getChildrenRecursive,
+    getBinangDegString,
 )
 
 from .oot_level_classes import (
@@ -125,7 +129,9 @@ def ootExportSceneToC(originalSceneObj, transformMatrix, sceneName, DLFormat, sa
         exportSubdir = os.path.dirname(getSceneDirFromLevelName(sceneName))
 
     roomObjList = [
-        obj for obj in originalSceneObj.children_recursive if obj.type == "EMPTY" and obj.ootEmptyType == "Room"
+        obj
+        for obj in getChildrenRecursive(buildChildIndex(bpy.data.objects), originalSceneObj)
+        if obj.type == "EMPTY" and obj.ootEmptyType == "Room"
     ]
     for roomObj in roomObjList:
         room = scene.rooms[roomObj.ootRoomHeader.roomIndex]
@@ -324,11 +330,14 @@ def readSceneData(
             )
 
 
+# Hacky solution to handle Z-up to Y-up conversion
+# We cannot apply rotation to empty, as that modifies scale
+zUpToYUpOrientation = mathutils.Quaternion((1, 0, 0), math.radians(90.0))
+
+
 def getConvertedTransform(transformMatrix, sceneObj, obj, handleOrientation):
-    # Hacky solution to handle Z-up to Y-up conversion
-    # We cannot apply rotation to empty, as that modifies scale
     if handleOrientation:
-        orientation = mathutils.Quaternion((1, 0, 0), math.radians(90.0))
+        orientation = zUpToYUpOrientation
     else:
         orientation = mathutils.Matrix.Identity(4)
     return getConvertedTransformWithOrientation(transformMatrix, sceneObj, obj, orientation)
@@ -336,6 +345,20 @@ def getConvertedTransform(transformMatrix, sceneObj, obj, handleOrientation):
 
 def getConvertedTransformWithOrientation(transformMatrix, sceneObj, obj, orientation):
     relativeTransform = transformMatrix @ sceneObj.matrix_world.inverted() @ obj.matrix_world
+    return convertRelativeTransform(relativeTransform, orientation)
+
+
+def getSceneTransform(transformMatrix, sceneObj):
+    """Returns the part of the relative transform shared by every object of the scene"""
+    return transformMatrix @ sceneObj.matrix_world.inverted()
+
+
+def getConvertedSceneTransform(sceneTransform, obj):
+    """Same as ``getConvertedTransform(..., True)`` using the result of ``getSceneTransform``"""
+    return convertRelativeTransform(sceneTransform @ obj.matrix_world, zUpToYUpOrientation)
+
+
+def convertRelativeTransform(relativeTransform, orientation):
     blenderTranslation, blenderRotation, scale = relativeTransform.decompose()
     rotation = blenderRotation @ orientation
     convertedTranslation = ootConvertTranslation(blenderTranslation)
@@ -344,6 +367,15 @@ def getConvertedTransformWithOrientation(transformMatrix, sceneObj, obj, orienta
     return convertedTranslation, convertedRotation, scale, rotation
 
 
+# ``ootData`` is built once when ``oot_constants`` is imported, so this cache never has to be cleared
+@functools.lru_cache(maxsize=None)
+def getActorDisplayName(actorID: str) -> str:
+    """Returns the name written as a comment above an actor entry, computed once per actor ID"""
+    if actorID != "Custom":
+        return ootData.actorData.actorsByID[actorID].name.replace(f" - {actorID.removeprefix('ACTOR_')}", "")
+    return "Custom Actor"
+
+
 def getExitData(exitProp):
     if exitProp.exitIndex != "Custom":
         raise PluginError("Exit index enums not implemented yet.")
@@ -516,21 +548,24 @@ def ootConvertScene(originalSceneObj, transformMatrix, sceneName, DLFormat, conv
     if bpy.context.scene.exportHiddenGeometry:
         restoreHiddenState(hiddenState)
 
-    roomObjs = [
-        child for child in sceneObj.children_recursive if child.type == "EMPTY" and child.ootEmptyType == "Room"
+    # classify every object of the hierarchy once, rooms are needed upfront for the check below
+    childIndex = buildChildIndex(bpy.data.objects)
+    sceneChildren = [
+        (child, child.ootEmptyType if child.type == "EMPTY" else None)
+        for child in getChildrenRecursive(childIndex, sceneObj)
     ]
-    if len(roomObjs) == 0:
+    if not any(emptyType == "Room" for _, emptyType in sceneChildren):
         raise PluginError("The scene has no child empties with the 'Room' empty type.")
 
     try:
         scene = OOTScene(sceneName, OOTModel(sceneName + "_dl", DLFormat, None))
+        scene.writeActorNames = bpy.context.scene.ootSceneExportSettings.writeActorNames
         readSceneData(scene, sceneObj.fast64.oot.scene, sceneObj.ootSceneHeader, sceneObj.ootAlternateSceneHeaders)
         processedRooms = set()
+        sceneTransform = getSceneTransform(transformMatrix, sceneObj)
 
-        for obj in sceneObj.children_recursive:
-            translation, rotation, scale, orientedRotation = getConvertedTransform(transformMatrix, sceneObj, obj, True)
-
-            if obj.type == "EMPTY" and obj.ootEmptyType == "Room":
+        for obj, emptyType in sceneChildren:
+            if emptyType == "Room":
                 roomObj = obj
                 roomHeader = roomObj.ootRoomHeader
                 roomIndex = roomHeader.roomIndex
@@ -545,11 +580,20 @@ def ootConvertScene(originalSceneObj, transformMatrix, sceneName, DLFormat, conv
                 if roomHeader.roomShape == "ROOM_SHAPE_TYPE_IMAGE" and len(processedRooms) > 1:
                     raise PluginError(f'Room shape "Image" can only have one room in the scene.')
 
+                translation, rotation, scale, orientedRotation = getConvertedSceneTransform(sceneTransform, obj)
                 cullGroup = CullGroup(translation, scale, obj.ootRoomHeader.defaultCullDistance)
                 DLGroup = room.mesh.addMeshGroup(cullGroup).DLGroup
                 boundingBox = BoundingBox()
                 ootProcessMesh(
-                    room.mesh, DLGroup, sceneObj, roomObj, transformMatrix, convertTextureData, None, boundingBox
+                    room.mesh,
+                    DLGroup,
+                    sceneObj,
+                    roomObj,
+                    transformMatrix,
+                    convertTextureData,
+                    None,
+                    boundingBox,
+                    childIndex,
                 )
                 centroid, radius = boundingBox.getEnclosingSphere()
                 cullGroup.position = centroid
@@ -557,8 +601,8 @@ def ootConvertScene(originalSceneObj, transformMatrix, sceneName, DLFormat, conv
 
                 room.mesh.terminateDLs()
                 room.mesh.removeUnusedEntries()
-                ootProcessEmpties(scene, room, sceneObj, roomObj, transformMatrix)
-            elif obj.type == "EMPTY" and obj.ootEmptyType == "Water Box":
+                ootProcessEmpties(scene, room, sceneObj, roomObj, transformMatrix, sceneTransform, childIndex)
+            elif emptyType == "Water Box":
                 # 0x3F = -1 in 6bit value
                 ootProcessWaterBox(sceneObj, obj, transformMatrix, scene, 0x3F)
             elif obj.type == "CAMERA":
@@ -628,7 +672,15 @@ class BoundingBox:
 # The copy will have modifiers / scale applied and will be made single user
 # When we duplicated obj hierarchy we stripped all ignore_renders from hierarchy.
 def ootProcessMesh(
-    roomMesh, DLGroup, sceneObj, obj, transformMatrix, convertTextureData, LODHierarchyObject, boundingBox: BoundingBox
+    roomMesh,
+    DLGroup,
+    sceneObj,
+    obj,
+    transformMatrix,
+    convertTextureData,
+    LODHierarchyObject,
+    boundingBox: BoundingBox,
+    childIndex: dict[Object, list[Object]],
 ):
     relativeTransform = transformMatrix @ sceneObj.matrix_world.inverted() @ obj.matrix_world
     translation, rotation, scale = relativeTransform.decompose()
@@ -670,7 +722,7 @@ def ootProcessMesh(
 
         boundingBox.addMeshObj(obj, relativeTransform)
 
-    alphabeticalChildren = sorted(obj.children, key=lambda childObj: childObj.original_name.lower())
+    alphabeticalChildren = sorted(childIndex.get(obj, []), key=lambda childObj: childObj.original_name.lower())
     for childObj in alphabeticalChildren:
         if childObj.type == "EMPTY" and childObj.ootEmptyType == "LOD":
             ootProcessLOD(
@@ -682,6 +734,7 @@ def ootProcessMesh(
                 convertTextureData,
                 LODHierarchyObject,
                 boundingBox,
+                childIndex,
             )
         else:
             ootProcessMesh(
@@ -693,11 +746,20 @@ def ootProcessMesh(
                 convertTextureData,
                 LODHierarchyObject,
                 boundingBox,
+                childIndex,
             )
 
 
 def ootProcessLOD(
-    roomMesh, DLGroup, sceneObj, obj, transformMatrix, convertTextureData, LODHierarchyObject, boundingBox: BoundingBox
+    roomMesh,
+    DLGroup,
+    sceneObj,
+    obj,
+    transformMatrix,
+    convertTextureData,
+    LODHierarchyObject,
+    boundingBox: BoundingBox,
+    childIndex: dict[Object, list[Object]],
 ):
     relativeTransform = transformMatrix @ sceneObj.matrix_world.inverted() @ obj.matrix_world
     translation, rotation, scale = relativeTransform.decompose()
@@ -711,7 +773,7 @@ def ootProcessLOD(
     )
 
     index = 0
-    for childObj in obj.children:
+    for childObj in childIndex.get(obj, []):
         # This group will not be converted to C directly, but its display lists will be converted through the FLODGroup.
         childDLGroup = OOTDLGroup(name + str(index), roomMesh.model.DLFormat)
         index += 1
@@ -726,6 +788,7 @@ def ootProcessLOD(
                 convertTextureData,
                 LODHierarchyObject,
                 boundingBox,
+                childIndex,
             )
         else:
             ootProcessMesh(
@@ -737,6 +800,7 @@ def ootProcessLOD(
                 convertTextureData,
                 LODHierarchyObject,
                 boundingBox,
+                childIndex,
             )
 
         # We handle case with no geometry, for the cases where we have "gaps" in the LOD hierarchy.
@@ -755,31 +819,29 @@ def ootProcessLOD(
     DLGroup.addDLCall(transparentLOD.draw, "Transparent")
 
 
-def ootProcessEmpties(scene, room, sceneObj, obj, transformMatrix):
-    translation, rotation, scale, orientedRotation = getConvertedTransform(transformMatrix, sceneObj, obj, True)
-
+def ootProcessEmpties(
+    scene, room, sceneObj, obj, transformMatrix, sceneTransform, childIndex: dict[Object, list[Object]]
+):
+    # the transform is only computed by the branches using it, after their cheaper checks
     if obj.type == "EMPTY":
-        if obj.ootEmptyType == "Actor":
+        emptyType = obj.ootEmptyType
+        if emptyType == "Actor":
             actorProp = obj.ootActorProperty
+            actorID = actorProp.actorID
 
             # The Actor list is filled with ``("None", f"{i} (Deleted from the XML)", "None")`` for
             # the total number of actors defined in the XML. If the user deletes one, this will prevent
             # any data loss as Blender saves the index of the element in the Actor list used for the EnumProperty
             # and not the identifier as defined by the first element of the tuple. Therefore, we need to check if
             # the current Actor has the ID `None` to avoid export issues.
-            if actorProp.actorID != "None":
+            if actorID != "None":
+                translation, rotation, scale, orientedRotation = getConvertedSceneTransform(sceneTransform, obj)
                 if actorProp.rotOverride:
                     actorRot = ", ".join([actorProp.rotOverrideX, actorProp.rotOverrideY, actorProp.rotOverrideZ])
                 else:
-                    actorRot = ", ".join(f"DEG_TO_BINANG({(rot * (180 / 0x8000)):.3f})" for rot in rotation)
-
-                actorName = (
-                    ootData.actorData.actorsByID[actorProp.actorID].name.replace(
-                        f" - {actorProp.actorID.removeprefix('ACTOR_')}", ""
-                    )
-                    if actorProp.actorID != "Custom"
-                    else "Custom Actor"
-                )
+                    actorRot = ", ".join([getBinangDegString(rot) for rot in rotation])
+
+                actorName = getActorDisplayName(actorID) if scene.writeActorNames else ""
 
                 addActor(
                     room,
@@ -794,26 +856,24 @@ def ootProcessEmpties(scene, room, sceneObj, obj, transformMatrix):
                     "actorList",
                     obj.name,
                 )
-        elif obj.ootEmptyType == "Transition Actor":
+        elif emptyType == "Transition Actor":
             transActorProp = obj.ootTransitionActorProperty
-            if transActorProp.actor.actorID != "None":
+            transActorID = transActorProp.actor.actorID
+            if transActorID != "None":
+                translation, rotation, scale, orientedRotation = getConvertedSceneTransform(sceneTransform, obj)
                 if transActorProp.isRoomTransition:
-                    if transActorProp.fromRoom is None or transActorProp.toRoom is None:
+                    fromRoom = transActorProp.fromRoom
+                    toRoom = transActorProp.toRoom
+                    if fromRoom is None or toRoom is None:
                         raise PluginError("ERROR: Missing room empty object assigned to transition.")
-                    fromIndex = transActorProp.fromRoom.ootRoomHeader.roomIndex
-                    toIndex = transActorProp.toRoom.ootRoomHeader.roomIndex
+                    fromIndex = fromRoom.ootRoomHeader.roomIndex
+                    toIndex = toRoom.ootRoomHeader.roomIndex
                 else:
                     fromIndex = toIndex = room.roomIndex
                 front = (fromIndex, getCustomProperty(transActorProp, "cameraTransitionFront"))
                 back = (toIndex, getCustomProperty(transActorProp, "cameraTransitionBack"))
 
-                transActorName = (
-                    ootData.actorData.actorsByID[transActorProp.actor.actorID].name.replace(
-                        f" - {transActorProp.actor.actorID.removeprefix('ACTOR_')}", ""
-                    )
-                    if transActorProp.actor.actorID != "Custom"
-                    else "Custom Actor"
-                )
+                transActorName = getActorDisplayName(transActorID) if scene.writeActorNames else ""
 
                 addActor(
                     scene,
@@ -832,7 +892,7 @@ def ootProcessEmpties(scene, room, sceneObj, obj, transformMatrix):
                     "transitionActorList",
                     obj.name,
                 )
-        elif obj.ootEmptyType == "Entrance":
+        elif emptyType == "Entrance":
             entranceProp = obj.ootEntranceProperty
             spawnIndex = entranceProp.spawnIndex
 
@@ -841,6 +901,8 @@ def ootProcessEmpties(scene, room, sceneObj, obj, transformMatrix):
             else:
                 raise PluginError("ERROR: Missing room empty object assigned to the entrance.")
 
+            translation, rotation, scale, orientedRotation = getConvertedSceneTransform(sceneTransform, obj)
+
             addActor(scene, OOTEntrance(roomIndex, spawnIndex), entranceProp.actor, "entranceList", obj.name)
             addStartPosition(
                 scene,
@@ -849,13 +911,13 @@ def ootProcessEmpties(scene, room, sceneObj, obj, transformMatrix):
                     "",
                     "ACTOR_PLAYER" if not entranceProp.customActor else entranceProp.actor.actorIDCustom,
                     translation,
-                    ", ".join(f"DEG_TO_BINANG({(rot * (180 / 0x8000)):.3f})" for rot in rotation),
+                    ", ".join([getBinangDegString(rot) for rot in rotation]),
                     entranceProp.actor.actorParam,
                 ),
                 entranceProp.actor,
                 obj.name,
             )
-        elif obj.ootEmptyType == "Water Box":
+        elif emptyType == "Water Box":
             ootProcessWaterBox(sceneObj, obj, transformMatrix, scene, room.roomIndex)
     elif obj.type == "CAMERA":
         camPosProp = obj.ootCameraPositionProperty
@@ -866,8 +928,8 @@ def ootProcessEmpties(scene, room, sceneObj, obj, transformMatrix):
         else:
             readCrawlspace(obj, scene, transformMatrix)
 
-    for childObj in obj.children:
-        ootProcessEmpties(scene, room, sceneObj, childObj, transformMatrix)
+    for childObj in childIndex.get(obj, []):
+        ootProcessEmpties(scene, room, sceneObj, childObj, transformMatrix, sceneTransform, childIndex)
 
 
 def ootProcessWaterBox(sceneObj, obj, transformMatrix, scene, roomIndex):
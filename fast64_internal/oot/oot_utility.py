@@ -348,6 +348,29 @@ def ootCleanupScene(originalSceneObj, allObjs):
     bpy.context.view_layer.objects.active = originalSceneObj
 
 
+def buildChildIndex(objList) -> dict[Object, list[Object]]:
+    """Returns a parent -> children map built in a single pass over ``objList``
+
+    ``Object.children`` and ``Object.children_recursive`` both scan every object in ``bpy.data.objects``,
+    so this should be used instead when walking a hierarchy"""
+    childIndex: dict[Object, list[Object]] = {}
+    for obj in objList:
+        if obj.parent is not None:
+            childIndex.setdefault(obj.parent, []).append(obj)
+    return childIndex
+
+
+def getChildrenRecursive(childIndex: dict[Object, list[Object]], obj: Object) -> list[Object]:
+    """Returns the same (depth-first) list as ``obj.children_recursive`` using a map from ``buildChildIndex``"""
+    children: list[Object] = []
+    stack = list(reversed(childIndex.get(obj, [])))
+    while len(stack) > 0:
+        childObj = stack.pop()
+        children.append(childObj)
+        stack.extend(reversed(childIndex.get(childObj, [])))
+    return children
+
+
 def getSceneObj(obj):
     while not (obj is None or (obj is not None and obj.type == "EMPTY" and obj.ootEmptyType == "Scene")):
         obj = obj.parent
@@ -512,6 +535,14 @@ def ootConvertRotation(rotation):
     return [int(round((math.degrees(value) % 360) / 360 * (2**16))) % (2**16) for value in rotation.to_euler()]
 
 
+binangToDegrees = 180 / 0x8000
+
+
+def getBinangDegString(binang: int) -> str:
+    """Returns a binary angle as a ``DEG_TO_BINANG()`` macro call"""
+    return "DEG_TO_BINANG(%.3f)" % (binang * binangToDegrees)
+
+
 # parse rotaion in Vec3s format
 def ootParseRotation(values: list[int]):
     return [
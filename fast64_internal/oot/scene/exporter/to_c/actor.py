@@ -1,5 +1,16 @@
 from .....utility import CData, indent
 from ....oot_level_classes import OOTScene, OOTRoom, OOTActor, OOTTransitionActor, OOTEntrance
+from ....oot_utility import getBinangDegString
+
+
+def getListSource(opening: str, entries: list[str], separator: str):
+    """Returns the definition of a C list, joined once so the entries aren't copied to an intermediate string"""
+    if separator != "":
+        sourceParts = [separator] * max(2 * len(entries) - 1, 0)
+        sourceParts[::2] = entries
+    else:
+        sourceParts = entries
+    return "".join([opening, *sourceParts, "};\n\n"])
 
 
 ###################
@@ -8,21 +19,28 @@ from ....oot_level_classes import OOTScene, OOTRoom, OOTActor, OOTTransitionActo
 
 # Actor List
 
+actorInfoPrefixes = tuple(
+    (indent * 2) + f"/* {desc:10} */ " for desc in ["Actor ID", "Position", "Rotation", "Parameters"]
+)
+
 
 def getActorEntry(actor: OOTActor):
     """Returns a single actor entry"""
-    posData = "{ " + ", ".join(f"{round(pos)}" for pos in actor.position) + " }"
+    posData = "{ %d, %d, %d }" % tuple([round(pos) for pos in actor.position])
     rotData = "{ " + "".join(actor.rotation) + " }"
 
     actorInfos = [actor.actorID, posData, rotData, actor.actorParam]
-    infoDescs = ["Actor ID", "Position", "Rotation", "Parameters"]
-
-    return (
-        indent
-        + (f"// {actor.actorName}\n" + indent if actor.actorName != "" else "")
-        + "{\n"
-        + ",\n".join((indent * 2) + f"/* {desc:10} */ {info}" for desc, info in zip(infoDescs, actorInfos))
-        + ("\n" + indent + "},\n")
+
+    return "".join(
+        [
+            indent,
+            f"// {actor.actorName}\n{indent}" if actor.actorName != "" else "",
+            "{\n",
+            ",\n".join([prefix + info for prefix, info in zip(actorInfoPrefixes, actorInfos)]),
+            "\n",
+            indent,
+            "},\n",
+        ]
     )
 
 
@@ -35,10 +53,10 @@ def getActorList(outRoom: OOTRoom, headerIndex: int):
     actorList.header = f"extern {declarationBase}[];\n"
 
     # .c
-    actorList.source = (
-        (f"{declarationBase}[{outRoom.getActorLengthDefineName(headerIndex)}]" + " = {\n")
-        + "\n".join(getActorEntry(actor) for actor in outRoom.actorList)
-        + "};\n\n"
+    actorList.source = getListSource(
+        f"{declarationBase}[{outRoom.getActorLengthDefineName(headerIndex)}]" + " = {\n",
+        [getActorEntry(actor) for actor in outRoom.actorList],
+        "\n",
     )
 
     return actorList
@@ -50,22 +68,35 @@ def getActorList(outRoom: OOTRoom, headerIndex: int):
 
 # Transition Actor List
 
+transActorInfoPrefixes = tuple(
+    (indent * 2) + f"/* {desc:30} */ "
+    for desc in ["Room & Cam Index (Front, Back)", "Actor ID", "Position", "Rotation Y", "Parameters"]
+)
+
 
 def getTransitionActorEntry(transActor: OOTTransitionActor):
     """Returns a single transition actor entry"""
-    sides = [(transActor.frontRoom, transActor.frontCam), (transActor.backRoom, transActor.backCam)]
-    roomData = "{ " + ", ".join(f"{room}, {cam}" for room, cam in sides) + " }"
-    posData = "{ " + ", ".join(f"{round(pos)}" for pos in transActor.position) + " }"
-    rotData = f"DEG_TO_BINANG({(transActor.rotationY * (180 / 0x8000)):.3f})"
+    roomData = "{ %s, %s, %s, %s }" % (
+        transActor.frontRoom,
+        transActor.frontCam,
+        transActor.backRoom,
+        transActor.backCam,
+    )
+    posData = "{ %d, %d, %d }" % tuple([round(pos) for pos in transActor.position])
+    rotData = getBinangDegString(transActor.rotationY)
 
     actorInfos = [roomData, transActor.actorID, posData, rotData, transActor.actorParam]
-    infoDescs = ["Room & Cam Index (Front, Back)", "Actor ID", "Position", "Rotation Y", "Parameters"]
 
-    return (
-        (indent + f"// {transActor.actorName}\n" + indent if transActor.actorName != "" else "")
-        + "{\n"
-        + ",\n".join((indent * 2) + f"/* {desc:30} */ {info}" for desc, info in zip(infoDescs, actorInfos))
-        + ("\n" + indent + "},\n")
+    return "".join(
+        [
+            indent,
+            f"// {transActor.actorName}\n{indent}" if transActor.actorName != "" else "",
+            "{\n",
+            ",\n".join([prefix + info for prefix, info in zip(transActorInfoPrefixes, actorInfos)]),
+            "\n",
+            indent,
+            "},\n",
+        ]
     )
 
 
@@ -78,10 +109,10 @@ def getTransitionActorList(outScene: OOTScene, headerIndex: int):
     transActorList.header = f"extern {declarationBase}[];\n"
 
     # .c
-    transActorList.source = (
-        (f"{declarationBase}[]" + " = {\n")
-        + "\n".join(getTransitionActorEntry(transActor) for transActor in outScene.transitionActorList)
-        + "};\n\n"
+    transActorList.source = getListSource(
+        f"{declarationBase}[]" + " = {\n",
+        [getTransitionActorEntry(transActor) for transActor in outScene.transitionActorList],
+        "\n",
     )
 
     return transActorList
@@ -99,10 +130,10 @@ def getSpawnActorList(outScene: OOTScene, headerIndex: int):
     spawnActorList.header = f"extern {declarationBase}[];\n"
 
     # .c
-    spawnActorList.source = (
-        (f"{declarationBase}[]" + " = {\n")
-        + "".join(getActorEntry(spawnActor) for spawnActor in outScene.startPositions.values())
-        + "};\n\n"
+    spawnActorList.source = getListSource(
+        f"{declarationBase}[]" + " = {\n",
+        [getActorEntry(spawnActor) for spawnActor in outScene.startPositions],
+        "",
     )
 
     return spawnActorList
@@ -110,7 +141,7 @@ def getSpawnActorList(outScene: OOTScene, headerIndex: int):
 
 def getSpawnEntry(entrance: OOTEntrance):
     """Returns a single spawn entry"""
-    return indent + "{ " + f"{entrance.startPositionIndex}, {entrance.roomIndex}" + " },\n"
+    return f"{indent}{{ {entrance.startPositionIndex}, {entrance.roomIndex} }},\n"
 
 
 def getSpawnList(outScene: OOTScene, headerIndex: int):
@@ -122,11 +153,10 @@ def getSpawnList(outScene: OOTScene, headerIndex: int):
     spawnList.header = f"extern {declarationBase}[];\n"
 
     # .c
-    spawnList.source = (
-        (f"{declarationBase}[]" + " = {\n")
-        + (indent + "// { Spawn Actor List Index, Room Index }\n")
-        + "".join(getSpawnEntry(entrance) for entrance in outScene.entranceList)
-        + "};\n\n"
+    spawnList.source = getListSource(
+        f"{declarationBase}[]" + " = {\n" + indent + "// { Spawn Actor List Index, Room Index }\n",
+        [getSpawnEntry(entrance) for entrance in outScene.entranceList],
+        "",
     )
 
     return spawnList
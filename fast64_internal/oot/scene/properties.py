@@ -487,6 +487,11 @@ class OOTExportSceneSettingsProperty(PropertyGroup):
         default=False,
         description="Does not split the scene and rooms into multiple files.",
     )
+    writeActorNames: BoolProperty(
+        name="Write Actor Name Comments",
+        default=True,
+        description="Writes the name of each actor as a comment above its entry.",
+    )
     option: EnumProperty(items=ootEnumSceneID, default="SCENE_DEKU_TREE")
 
     def draw_props(self, layout: UILayout):
@@ -502,6 +507,7 @@ class OOTExportSceneSettingsProperty(PropertyGroup):
         prop_split(layout, bpy.context.scene, "ootSceneExportObj", "Scene Object")
 
         layout.prop(self, "singleFile")
+        layout.prop(self, "writeActorNames")
         layout.prop(self, "customExport")
 
 